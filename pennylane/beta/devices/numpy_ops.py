@@ -36,11 +36,8 @@ def spectral_decomposition(A):
             such that :math:`A = \sum_k a_k P_k`.
     """
     d, v = eigh(A)
-    P = []
-    for k in range(d.shape[0]):
-        temp = v[:, k]
-        P.append(np.outer(temp, temp.conj()))
-    return d, P
+    P = np.einsum("ik,jk->kij", v, v.conj())
+    return d, list(P)
 
 
 # ========================================================
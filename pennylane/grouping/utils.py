@@ -733,7 +733,8 @@ def qwc_complement_adj_matrix(binary_observables):
         array[array[int]]: the adjacency matrix for the complement of the qubit-wise commutativity graph
 
     Raises:
-        ValueError: if input binary observables contain components which are not strictly binary
+        ValueError: if input binary observables contain components which are not strictly binary,
+            or if the rows have an odd number of components
 
     **Example**
 
@@ -754,12 +755,30 @@ def qwc_complement_adj_matrix(binary_observables):
     if not np.array_equal(binary_observables, binary_observables.astype(bool)):
         raise ValueError("Expected a binary array, instead got {}".format(binary_observables))
 
-    m_terms = np.shape(binary_observables)[0]
-    adj = np.zeros((m_terms, m_terms))
+    if np.shape(binary_observables)[0] == 0:
+        return np.zeros((0, 0))
 
-    for i in range(m_terms):
-        for j in range(i + 1, m_terms):
-            adj[i, j] = int(not is_qwc(binary_observables[i], binary_observables[j]))
-            adj[j, i] = adj[i, j]
+    n_components = np.shape(binary_observables)[1]
 
-    return adj
+    if n_components % 2 != 0:
+        raise ValueError(
+            "Expected an even number of binary components for each Pauli word, instead got "
+            "{}".format(n_components)
+        )
+
+    n_qubits = n_components // 2
+    x = binary_observables[:, :n_qubits].astype(bool)
+    z = binary_observables[:, n_qubits:].astype(bool)
+
+    # two Pauli words fail to qubit-wise commute iff they are both non-identity on some
+    # qubit where they differ; count, for every pair, the qubits where both act non-trivially
+    # and the qubits where both apply the same Pauli, each as a single matrix product
+    support = (x | z).astype(int)
+    overlap = support @ support.T
+
+    same = np.zeros_like(overlap)
+    for pauli in (x & ~z, x & z, ~x & z):
+        pauli = pauli.astype(int)
+        same += pauli @ pauli.T
+
+    return (overlap > same).astype(float)
@@ -16,9 +16,13 @@ Methods for generating QAOA cost Hamiltonians corresponding to
 different optimization problems.
 """
 
+import functools
+import itertools
 import networkx as nx
+import numpy as np
 import pennylane as qml
 from pennylane import qaoa
+from pennylane.qaoa.mixers import _id, _pz
 
 
 ########################
@@ -61,7 +65,7 @@ def bit_driver(wires, b):
     else:
         raise ValueError("'b' must be either 0 or 1, got {}".format(b))
 
-    ops = [qml.PauliZ(w) for w in wires]
+    ops = [_pz(w) for w in wires]
     return qml.Hamiltonian(coeffs, ops)
 
 
@@ -162,44 +166,140 @@ def edge_driver(graph, reward):
     if not isinstance(graph, nx.Graph):
         raise ValueError("Input graph must be a nx.Graph, got {}".format(type(graph).__name__))
 
-    coeffs = []
-    ops = []
+    coeffs, ops = _edge_driver_terms(tuple(graph.nodes), tuple(graph.edges), frozenset(reward))
+    return qml.Hamiltonian(list(coeffs), list(ops))
 
+
+def _edge_driver_terms(nodes, edges, reward):
+    """Computes the coefficients and observables of the edge-driver Hamiltonian.
+
+    The observables are built from the memoized factors returned by
+    :func:`_edge_driver_factors`. Products of factors are returned as new tensors on every call,
+    since tensors are modified in-place by ``@`` and cannot be shared between Hamiltonians.
+
+    Args:
+        nodes (tuple): the nodes of the graph
+        edges (tuple[tuple]): the edges of the graph
+        reward (frozenset[str]): the validated two-bit bitstrings that are assigned a lower energy
+
+    Returns:
+        (tuple[float], tuple[.Observable]): the coefficients and observables of the Hamiltonian
+    """
+    coeffs, factors = _edge_driver_factors(nodes, edges, reward)
+    ops = tuple(f[0] if len(f) == 1 else qml.operation.Tensor(*f) for f in factors)
+    return coeffs, ops
+
+
+@functools.lru_cache(maxsize=128)
+def _edge_driver_factors(nodes, edges, reward):
+    """Computes the coefficients and the factors of the observables of the edge-driver Hamiltonian.
+
+    The result is memoized on the node and edge tuples of the graph and the reward set,
+    so that repeatedly constructing the same cost Hamiltonian reuses the single-qubit observables.
+
+    Args:
+        nodes (tuple): the nodes of the graph
+        edges (tuple[tuple]): the edges of the graph
+        reward (frozenset[str]): the validated two-bit bitstrings that are assigned a lower energy
+
+    Returns:
+        (tuple[float], tuple[tuple[.Observable]]): the coefficients of the Hamiltonian, and the
+        single-qubit factors of each of its observables
+    """
     if len(reward) == 0 or len(reward) == 4:
-        coeffs = [1 for _ in graph.nodes]
-        ops = [qml.Identity(v) for v in graph.nodes]
+        return tuple(1 for _ in nodes), tuple((_id(v),) for v in nodes)
+
+    reward = list(reward - {"01"})
+    sign = -1
+
+    if len(reward) == 2:
+        reward = list({"00", "10", "11"} - set(reward))
+        sign = 1
+
+    reward = reward[0]
+
+    if reward == "10":
+        coeffs = np.full(len(edges), -0.5 * sign)
+        factors = [(_pz(e[0]), _pz(e[1])) for e in edges]
 
     else:
+        # each edge contributes the terms Z_i Z_j, Z_i and Z_j, in that order
+        coeffs = np.full((len(edges), 3), 0.25 * sign)
 
-        reward = list(set(reward) - {"01"})
-        sign = -1
+        if reward == "11":
+            coeffs[:, 1:] *= -1
 
-        if len(reward) == 2:
-            reward = list({"00", "10", "11"} - set(reward))
-            sign = 1
+        factors = [f for e in edges for f in ((_pz(e[0]), _pz(e[1])), (_pz(e[0]),), (_pz(e[1]),))]
 
-        reward = reward[0]
+    return tuple(coeffs.ravel().tolist()), tuple(factors)
 
-        if reward == "00":
-            for e in graph.edges:
-                coeffs.extend([0.25 * sign, 0.25 * sign, 0.25 * sign])
-                ops.extend(
-                    [qml.PauliZ(e[0]) @ qml.PauliZ(e[1]), qml.PauliZ(e[0]), qml.PauliZ(e[1])]
-                )
 
-        if reward == "10":
-            for e in graph.edges:
-                coeffs.append(-0.5 * sign)
-                ops.append(qml.PauliZ(e[0]) @ qml.PauliZ(e[1]))
+@functools.lru_cache(maxsize=128)
+def _graph_complement(graph_type, nodes, edges):
+    """Returns the complement of the graph with the given nodes and edges.
 
-        if reward == "11":
-            for e in graph.edges:
-                coeffs.extend([0.25 * sign, -0.25 * sign, -0.25 * sign])
-                ops.extend(
-                    [qml.PauliZ(e[0]) @ qml.PauliZ(e[1]), qml.PauliZ(e[0]), qml.PauliZ(e[1])]
-                )
+    The complement is memoized on the structure of the graph, so that repeatedly constructing
+    Hamiltonians for the same graph does not recompute it. The returned graph is shared between
+    calls and must not be modified.
+
+    Args:
+        graph_type (type): the NetworkX graph class of the original graph
+        nodes (tuple): the nodes of the graph
+        edges (tuple[tuple]): the edges of the graph
+
+    Returns:
+        nx.Graph: the complement of the graph
+    """
+    complement = graph_type()
+    complement.add_nodes_from(nodes)
+
+    if complement.is_multigraph():
+        complement.add_edges_from(edges)
+        return nx.complement(complement)
+
+    complement.add_edges_from(_complement_edges(nodes, edges, complement.is_directed()))
+    return complement
 
-    return qml.Hamiltonian(coeffs, ops)
+
+@functools.lru_cache(maxsize=128)
+def _complement_edges(nodes, edges, directed):
+    """Returns the edges of the complement of the graph with the given nodes and edges.
+
+    The edges are generated directly from the pairs of nodes, without allocating the complement
+    graph, and are ordered in the same way as the edges of ``nx.complement``.
+
+    Args:
+        nodes (tuple): the nodes of the graph
+        edges (tuple[tuple]): the edges of the graph, optionally followed by their multigraph keys
+        directed (bool): whether the edges of the graph are directed
+
+    Returns:
+        tuple[tuple]: the edges of the complement of the graph
+    """
+    if directed:
+        edge_set = frozenset(e[:2] for e in edges)
+        return tuple(pair for pair in itertools.permutations(nodes, 2) if pair not in edge_set)
+
+    edge_set = frozenset(frozenset(e[:2]) for e in edges)
+    return tuple(
+        pair for pair in itertools.combinations(nodes, 2) if frozenset(pair) not in edge_set
+    )
+
+
+def _build_hamiltonian(*terms):
+    """Builds a simplified Hamiltonian from several collections of terms in a single pass.
+
+    This avoids constructing, rescaling and adding intermediate Hamiltonians when the
+    terms of each component are already known.
+
+    Args:
+        *terms (Iterable[tuple[float, .Observable]]): iterables of ``(coeff, op)`` pairs
+
+    Returns:
+        .Hamiltonian: the Hamiltonian with all terms, with like-terms combined
+    """
+    pairs = list(itertools.chain.from_iterable(terms))
+    return qml.Hamiltonian([c for c, _ in pairs], [op for _, op in pairs], simplify=True)
 
 
 #######################
@@ -253,11 +353,20 @@ def maxcut(graph):
     if not isinstance(graph, nx.Graph):
         raise ValueError("Input graph must be a nx.Graph, got {}".format(type(graph).__name__))
 
-    identity_h = qml.Hamiltonian(
-        [-0.5 for e in graph.edges], [qml.Identity(e[0]) @ qml.Identity(e[1]) for e in graph.edges]
-    )
-    H = edge_driver(graph, ["10", "01"]) + identity_h
-    return (H, qaoa.x_mixer(graph.nodes))
+    nodes = tuple(graph.nodes)
+    edges = tuple(graph.edges)
+    coeffs, ops = _edge_driver_terms(nodes, edges, frozenset(["10", "01"]))
+    coeffs, ops = list(coeffs), list(ops)
+
+    if edges:
+        # the -I/2 contributions of all edges are combined into a single constant term
+        coeffs.append(-0.5 * len(edges))
+        ops.append(_id(edges[0][0]))
+
+    # parallel edges of multigraphs, and antiparallel edges of directed graphs, produce repeated
+    # ZZ terms that need to be combined
+    H = qml.Hamiltonian(coeffs, ops, simplify=graph.is_multigraph() or graph.is_directed())
+    return (H, qaoa.x_mixer(nodes))
 
 
 def max_independent_set(graph, constrained=True):
@@ -320,11 +429,16 @@ def max_independent_set(graph, constrained=True):
     if not isinstance(graph, nx.Graph):
         raise ValueError("Input graph must be a nx.Graph, got {}".format(type(graph).__name__))
 
+    nodes = tuple(graph.nodes)
+
     if constrained:
-        return (bit_driver(graph.nodes, 1), qaoa.bit_flip_mixer(graph, 0))
+        return (bit_driver(nodes, 1), qaoa.bit_flip_mixer(graph, 0))
 
-    cost_h = 3 * edge_driver(graph, ["10", "01", "00"]) + bit_driver(graph.nodes, 1)
-    mixer_h = qaoa.x_mixer(graph.nodes)
+    coeffs, ops = _edge_driver_terms(nodes, tuple(graph.edges), frozenset(["10", "01", "00"]))
+    cost_h = _build_hamiltonian(
+        ((3 * c, op) for c, op in zip(coeffs, ops)), ((1, _pz(w)) for w in nodes)
+    )
+    mixer_h = qaoa.x_mixer(nodes)
 
     return (cost_h, mixer_h)
 
@@ -391,11 +505,16 @@ def min_vertex_cover(graph, constrained=True):
     if not isinstance(graph, nx.Graph):
         raise ValueError("Input graph must be a nx.Graph, got {}".format(type(graph).__name__))
 
+    nodes = tuple(graph.nodes)
+
     if constrained:
-        return (bit_driver(graph.nodes, 0), qaoa.bit_flip_mixer(graph, 1))
+        return (bit_driver(nodes, 0), qaoa.bit_flip_mixer(graph, 1))
 
-    cost_h = 3 * edge_driver(graph, ["11", "10", "01"]) + bit_driver(graph.nodes, 0)
-    mixer_h = qaoa.x_mixer(graph.nodes)
+    coeffs, ops = _edge_driver_terms(nodes, tuple(graph.edges), frozenset(["11", "10", "01"]))
+    cost_h = _build_hamiltonian(
+        ((3 * c, op) for c, op in zip(coeffs, ops)), ((-1, _pz(w)) for w in nodes)
+    )
+    mixer_h = qaoa.x_mixer(nodes)
 
     return (cost_h, mixer_h)
 
@@ -464,11 +583,23 @@ def max_clique(graph, constrained=True):
     if not isinstance(graph, nx.Graph):
         raise ValueError("Input graph must be a nx.Graph, got {}".format(type(graph).__name__))
 
+    nodes = tuple(graph.nodes)
+    edges = tuple(graph.edges)
+
     if constrained:
-        return (bit_driver(graph.nodes, 1), qaoa.bit_flip_mixer(nx.complement(graph), 0))
+        complement = _graph_complement(type(graph), nodes, edges)
+        return (bit_driver(nodes, 1), qaoa.bit_flip_mixer(complement, 0))
 
-    cost_h = 3 * edge_driver(nx.complement(graph), ["10", "01", "00"]) + bit_driver(graph.nodes, 1)
-    mixer_h = qaoa.x_mixer(graph.nodes)
+    if graph.is_multigraph():
+        complement_edges = tuple(_graph_complement(type(graph), nodes, edges).edges)
+    else:
+        complement_edges = _complement_edges(nodes, edges, graph.is_directed())
+
+    coeffs, ops = _edge_driver_terms(nodes, complement_edges, frozenset(["10", "01", "00"]))
+    cost_h = _build_hamiltonian(
+        ((3 * c, op) for c, op in zip(coeffs, ops)), ((1, _pz(w)) for w in nodes)
+    )
+    mixer_h = qaoa.x_mixer(nodes)
 
     return (cost_h, mixer_h)
 
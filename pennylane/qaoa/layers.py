@@ -17,6 +17,8 @@ Methods that define cost and mixer layers for use in QAOA workflows.
 import pennylane as qml
 from pennylane.operation import Tensor
 
+_DIAGONAL_PAULIS = frozenset({"PauliZ", "Identity"})
+
 
 def _diagonal_terms(hamiltonian):
     r"""Checks if all terms in a Hamiltonian are products of diagonal Pauli gates
@@ -28,16 +30,11 @@ def _diagonal_terms(hamiltonian):
     Returns:
         bool: ``True`` if all terms are products of diagonal Pauli gates, ``False`` otherwise
     """
-    val = True
-
-    for i in hamiltonian.ops:
-        obs = i.obs if isinstance(i, Tensor) else [i]
-        for j in obs:
-            if j.name not in ("PauliZ", "Identity"):
-                val = False
-                break
-
-    return val
+    return all(
+        j.name in _DIAGONAL_PAULIS
+        for i in hamiltonian.ops
+        for j in (i.obs if isinstance(i, Tensor) else [i])
+    )
 
 
 def cost_layer(gamma, hamiltonian):
@@ -17,10 +17,35 @@ Methods for constructing QAOA mixer Hamiltonians.
 import itertools
 import functools
 import networkx as nx
+import numpy as np
 import pennylane as qml
 from pennylane.wires import Wires
 
 
+@functools.lru_cache(maxsize=None, typed=True)
+def _px(wire):
+    """Returns a cached :class:`~.PauliX` observable acting on ``wire``."""
+    return qml.PauliX(wire, do_queue=False)
+
+
+@functools.lru_cache(maxsize=None, typed=True)
+def _py(wire):
+    """Returns a cached :class:`~.PauliY` observable acting on ``wire``."""
+    return qml.PauliY(wire, do_queue=False)
+
+
+@functools.lru_cache(maxsize=None, typed=True)
+def _pz(wire):
+    """Returns a cached :class:`~.PauliZ` observable acting on ``wire``."""
+    return qml.PauliZ(wire, do_queue=False)
+
+
+@functools.lru_cache(maxsize=None, typed=True)
+def _id(wire):
+    """Returns a cached :class:`~.Identity` observable acting on ``wire``."""
+    return qml.Identity(wire, do_queue=False)
+
+
 def x_mixer(wires):
     r"""Creates a basic Pauli-X mixer Hamiltonian.
 
@@ -54,11 +79,26 @@ def x_mixer(wires):
     """
 
     wires = Wires(wires)
+    coeffs, obs = _x_mixer_terms(wires.labels)
 
-    coeffs = [1 for w in wires]
-    obs = [qml.PauliX(w) for w in wires]
+    return qml.Hamiltonian(list(coeffs), list(obs))
 
-    return qml.Hamiltonian(coeffs, obs)
+
+@functools.lru_cache(maxsize=128)
+def _x_mixer_terms(wires):
+    """Computes the coefficients and observables of the Pauli-X mixer Hamiltonian.
+
+    The result is memoized on the wire labels, so that the mixer for a given set of
+    wires is only constructed once. A new :class:`~.Hamiltonian` must be created from
+    the returned terms on every call, since Hamiltonians can be modified in place.
+
+    Args:
+        wires (tuple): the labels of the wires on which the Hamiltonian is applied
+
+    Returns:
+        (tuple[int], tuple[.Observable]): the coefficients and observables of the Hamiltonian
+    """
+    return tuple(1 for _ in wires), tuple(_px(w) for w in wires)
 
 
 def xy_mixer(graph):
@@ -101,13 +141,12 @@ def xy_mixer(graph):
             "Input graph must be a nx.Graph object, got {}".format(type(graph).__name__)
         )
 
-    edges = graph.edges
-    coeffs = 2 * [0.5 for e in edges]
-
-    obs = []
-    for node1, node2 in edges:
-        obs.append(qml.PauliX(node1) @ qml.PauliX(node2))
-        obs.append(qml.PauliY(node1) @ qml.PauliY(node2))
+    coeffs = np.full(2 * graph.number_of_edges(), 0.5)
+    obs = [
+        op
+        for node1, node2 in graph.edges
+        for op in (_px(node1) @ _px(node2), _py(node1) @ _py(node2))
+    ]
 
     return qml.Hamiltonian(coeffs, obs)
 
@@ -82,7 +82,7 @@ PATTERN_TO_NUM_PARAMS = {
     "double_odd": lambda wires: 0 if len(wires) in [0, 1] else (len(wires) - 1) // 2,
     "chain": lambda wires: 0 if len(wires) in [0, 1] else len(wires) - 1,
     "ring": lambda wires: 0 if len(wires) in [0, 1] else (1 if len(wires) == 2 else len(wires)),
-    "pyramid": lambda w: 0 if len(w) in [0, 1] else sum(i + 1 for i in range(len(w) // 2)),
+    "pyramid": lambda wires: (len(wires) // 2) * (len(wires) // 2 + 1) // 2,
     "all_to_all": lambda wires: 0 if len(wires) in [0, 1] else len(wires) * (len(wires) - 1) // 2,
     "custom": lambda wires: len(wires) if wires is not None else None,
 }
@@ -15,10 +15,28 @@ r"""
 Contains the ApproxTimeEvolution template.
 """
 # pylint: disable-msg=too-many-branches,too-many-arguments,protected-access
+import functools
+
 import pennylane as qml
 from pennylane.operation import Operation, AnyWires
 from pennylane.ops import PauliRot
 
+_PAULI_MAP = {"Identity": "I", "PauliX": "X", "PauliY": "Y", "PauliZ": "Z"}
+
+
+@functools.lru_cache(maxsize=1024)
+def _pauli_word(names):
+    """Returns the Pauli word for a tuple of observable names, or ``None`` if all are identities."""
+    if all(name == "Identity" for name in names):
+        return None
+
+    try:
+        return "".join(_PAULI_MAP[name] for name in names)
+    except KeyError as error:
+        raise ValueError(
+            "hamiltonian must be written in terms of Pauli matrices, got {}".format(error)
+        ) from error
+
 
 class ApproxTimeEvolution(Operation):
     r"""Applies the Trotterized time-evolution operator for an arbitrary Hamiltonian, expressed in terms
@@ -122,38 +140,32 @@ class ApproxTimeEvolution(Operation):
         time = self.parameters[1]
         n = self.parameters[2]
 
-        pauli = {"Identity": "I", "PauliX": "X", "PauliY": "Y", "PauliZ": "Z"}
+        # scaling shared by every term; computed once so that only kept terms pay a multiply
+        scale = 2 * time / n
 
         theta = []
         pauli_words = []
         wires = []
 
-        for i, term in enumerate(hamiltonian.ops):
-
-            word = ""
+        for coeff, term in zip(hamiltonian.coeffs, hamiltonian.ops):
 
-            try:
-                if isinstance(term.name, str):
-                    word = pauli[term.name]
+            names = (term.name,) if isinstance(term.name, str) else tuple(term.name)
+            word = _pauli_word(names)
 
-                if isinstance(term.name, list):
-                    word = "".join(pauli[j] for j in term.name)
+            # skips terms composed solely of identities
+            if word is None:
+                continue
 
-            except KeyError as error:
-                raise ValueError(
-                    "hamiltonian must be written in terms of Pauli matrices, got {}".format(error)
-                ) from error
+            theta.append(scale * coeff)
+            pauli_words.append(word)
+            wires.append(term.wires)
 
-            # skips terms composed solely of identities
-            if word.count("I") != len(word):
-                theta.append((2 * time * hamiltonian.coeffs[i]) / n)
-                pauli_words.append(word)
-                wires.append(term.wires)
+        terms = tuple(zip(theta, pauli_words, wires))
 
         with qml.tape.QuantumTape() as tape:
 
-            for i in range(n):
-                for j, term in enumerate(pauli_words):
-                    PauliRot(theta[j], term, wires=wires[j])
+            for _ in range(n):
+                for th, word, term_wires in terms:
+                    PauliRot(th, word, wires=term_wires)
 
         return tape
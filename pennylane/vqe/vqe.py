@@ -98,7 +98,7 @@ class Hamiltonian:
                 "number of coefficients and operators does not match."
             )
 
-        if any(np.imag(coeffs) != 0):
+        if np.iscomplexobj(coeffs) and np.any(np.imag(coeffs) != 0):
             raise ValueError(
                 "Could not create valid Hamiltonian; " "coefficients are not real-valued."
             )
@@ -172,52 +172,39 @@ class Hamiltonian:
           (-1) [X0]
         + (1) [Y2]
         """
-        coeffs = []
-        ops = []
+        # like-terms are grouped by their order-independent serialization (the same data
+        # used by ``compare``), so each term costs a single hashed lookup
+        groups = {}
 
         for c, op in zip(self.coeffs, self.ops):
             op = op if isinstance(op, Tensor) else Tensor(op)
+            key = frozenset(op._obs_data())  # pylint: disable=protected-access
 
-            ind = None
-            for i, other in enumerate(ops):
-                if op.compare(other):
-                    ind = i
-                    break
-
-            if ind is not None:
-                coeffs[ind] += c
-                if np.allclose([coeffs[ind]], [0]):
-                    del coeffs[ind]
-                    del ops[ind]
+            if key in groups:
+                groups[key][0] += c
+                if np.allclose([groups[key][0]], [0]):
+                    del groups[key]
             else:
-                ops.append(op.prune())
-                coeffs.append(c)
+                groups[key] = [c, op.prune()]
 
-        self._coeffs = coeffs
-        self._ops = ops
+        self._coeffs = [c for c, _ in groups.values()]
+        self._ops = [op for _, op in groups.values()]
 
     def __str__(self):
-        # Lambda function that formats the wires
-        wires_print = lambda ob: "'".join(map(str, ob.wires.tolist()))
+        obs_name = OBS_MAP.get
 
-        paired_coeff_obs = list(zip(self.coeffs, self.ops))
-        paired_coeff_obs.sort(key=lambda pair: (len(pair[1].wires), pair[0]))
-
-        terms_ls = []
-
-        for coeff, obs in paired_coeff_obs:
-
-            if isinstance(obs, Tensor):
-                obs_strs = [f"{OBS_MAP.get(ob.name, ob.name)}{wires_print(ob)}" for ob in obs.obs]
-                ob_str = " ".join(obs_strs)
-            elif isinstance(obs, Observable):
-                ob_str = f"{OBS_MAP.get(obs.name, obs.name)}{wires_print(obs)}"
-
-            term_str = f"({coeff}) [{ob_str}]"
+        def term_str(term):
+            # formats each factor as its short name followed by its wires, e.g., X0 or Hermitian0'1
+            factors = term.obs if isinstance(term, Tensor) else [term]
+            return " ".join(
+                obs_name(ob.name, ob.name) + "'".join(map(str, ob.wires.tolist())) for ob in factors
+            )
 
-            terms_ls.append(term_str)
+        paired_coeff_obs = sorted(
+            zip(self.coeffs, self.ops), key=lambda pair: (len(pair[1].wires), pair[0])
+        )
 
-        return "  " + "\n+ ".join(terms_ls)
+        return "  " + "\n+ ".join(f"({coeff}) [{term_str(obs)}]" for coeff, obs in paired_coeff_obs)
 
     def __repr__(self):
         # Constructor-call-like representation
@@ -334,7 +321,7 @@ class Hamiltonian:
 
         if isinstance(H, (Tensor, Observable)):
             coeffs = coeffs1
-            terms = [term @ H for term in terms1]
+            terms = [qml.operation.Tensor(term, H) for term in terms1]
 
             return qml.Hamiltonian(coeffs, terms, simplify=True)
 
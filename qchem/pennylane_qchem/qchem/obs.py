@@ -14,9 +14,13 @@
 """This module contains functions to construct many-body observables whose expectation
 values can be used to simulate molecular properties.
 """
-# pylint: disable=too-many-arguments, too-few-public-methods
+# pylint: disable=too-many-arguments, too-few-public-methods, protected-access
+import functools
+
 import numpy as np
 
+import pennylane as qml
+
 from . import openfermion, structure
 
 
@@ -214,6 +218,30 @@ def spin2(electrons, orbitals, mapping="jordan_wigner", wires=None):
     return observable([s2_op], mapping=mapping, wires=wires)
 
 
+def _mapping_name(mapping):
+    r"""Returns the normalized name of a fermion-to-qubit mapping.
+
+    Args:
+        mapping (str): the fermion-to-qubit mapping, either ``'jordan_wigner'`` or
+            ``'bravyi_kitaev'``, up to case and surrounding whitespace
+
+    Returns:
+        str: the lowercase name of the mapping without surrounding whitespace
+
+    Raises:
+        TypeError: if the mapping is not available
+    """
+    name = mapping.strip().lower()
+
+    if name not in ("jordan_wigner", "bravyi_kitaev"):
+        raise TypeError(
+            "The '{}' transformation is not available. \n "
+            "Please set 'mapping' to 'jordan_wigner' or 'bravyi_kitaev'.".format(mapping)
+        )
+
+    return name
+
+
 def observable(fermion_ops, init_term=0, mapping="jordan_wigner", wires=None):
 
     r"""Builds the Fermion many-body observable whose expectation value can be
@@ -293,11 +321,7 @@ def observable(fermion_ops, init_term=0, mapping="jordan_wigner", wires=None):
     + (-0.075) [Z0 Z2]
     """
 
-    if mapping.strip().lower() not in ("jordan_wigner", "bravyi_kitaev"):
-        raise TypeError(
-            "The '{}' transformation is not available. \n "
-            "Please set 'mapping' to 'jordan_wigner' or 'bravyi_kitaev'.".format(mapping)
-        )
+    mapping = _mapping_name(mapping)
 
     # Initialize the FermionOperator
     mb_obs = openfermion.ops.FermionOperator("") * init_term
@@ -311,7 +335,7 @@ def observable(fermion_ops, init_term=0, mapping="jordan_wigner", wires=None):
         mb_obs += ops
 
     # Map the fermionic operator to a qubit operator
-    if mapping.strip().lower() == "bravyi_kitaev":
+    if mapping == "bravyi_kitaev":
         return structure.convert_observable(
             openfermion.transforms.bravyi_kitaev(mb_obs), wires=wires
         )
@@ -376,6 +400,53 @@ def spin_z(orbitals, mapping="jordan_wigner", wires=None):
     return observable([sz_op], mapping=mapping, wires=wires)
 
 
+def _bk_flip_set(j):
+    r"""Returns the flip set :math:`F(j)` of qubit :math:`j` in the Bravyi-Kitaev encoding.
+
+    These are the qubits whose stored partial sums, together with qubit :math:`j`, determine
+    the occupation of orbital :math:`j`. They are the children of :math:`j` in the Fenwick tree,
+    as defined in `arXiv:1208.5986 <https://arxiv.org/abs/1208.5986>`_.
+
+    Args:
+        j (int): qubit index
+
+    Returns:
+        list[int]: indices of the qubits in the flip set, in ascending order
+    """
+    lowest = j - ((j + 1) & -(j + 1))
+    flip_set = []
+
+    k = j - 1
+    while k > lowest:
+        flip_set.append(k)
+        k -= (k + 1) & -(k + 1)
+
+    return flip_set[::-1]
+
+
+@functools.lru_cache(maxsize=32)
+def _number_op_qubits(orbitals, mapping):
+    r"""Returns the qubits entering the :math:`Z` string of each number operator
+    :math:`\hat{n}_j = \hat{c}_j^\dagger \hat{c}_j`.
+
+    Under both mappings :math:`\hat{n}_j = \frac{1}{2}(I - \prod_k Z_k)`. For the Jordan-Wigner
+    transformation the product runs over qubit :math:`j` only, while for the Bravyi-Kitaev
+    transformation it also includes the flip set :math:`F(j)`. The result is cached, so the
+    flip sets are computed once per number of orbitals.
+
+    Args:
+        orbitals (int): number of spin orbitals
+        mapping (str): either ``'jordan_wigner'`` or ``'bravyi_kitaev'``
+
+    Returns:
+        tuple[tuple[int]]: the qubit indices of the :math:`Z` string for each orbital
+    """
+    if mapping == "bravyi_kitaev":
+        return tuple(tuple(_bk_flip_set(j)) + (j,) for j in range(orbitals))
+
+    return tuple((j,) for j in range(orbitals))
+
+
 def particle_number(orbitals, mapping="jordan_wigner", wires=None):
     r"""Computes the particle number operator :math:`\hat{N}=\sum_\alpha \hat{n}_\alpha`
     in the Pauli basis.
@@ -429,14 +500,19 @@ def particle_number(orbitals, mapping="jordan_wigner", wires=None):
             "'orbitals' must be greater than 0; got for 'orbitals' {}".format(orbitals)
         )
 
-    r = np.arange(orbitals)
-    table = np.vstack([r, r, np.ones([orbitals])]).T
+    mapping = _mapping_name(mapping)
+    wires = structure._process_wires(wires, n_wires=orbitals)
 
-    N_obs = openfermion.ops.FermionOperator()
-    for i in table:
-        N_obs += openfermion.ops.FermionOperator(((int(i[0]), 1), (int(i[1]), 0)), i[2])
+    # the number operators map directly onto Z strings, so the fermionic operator is not built;
+    # each number operator contributes 1/2 to the identity and -1/2 to its Z string
+    coeffs = np.full(orbitals + 1, -0.5)
+    coeffs[0] = orbitals / 2
+    ops = [qml.operation.Tensor(structure._pauli("I", wires[0]))] + [
+        qml.operation.Tensor(*[structure._pauli("Z", wires[k]) for k in qubits])
+        for qubits in _number_op_qubits(orbitals, mapping)
+    ]
 
-    return observable([N_obs], mapping=mapping, wires=wires)
+    return qml.Hamiltonian(coeffs, ops)
 
 
 def one_particle(matrix_elements, core=None, active=None, cutoff=1.0e-12):
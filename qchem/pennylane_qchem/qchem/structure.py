@@ -13,6 +13,7 @@
 # limitations under the License.
 """This module contains the core functions for electronic structure calculations,
 and converting the resulting data structures to forms understood by PennyLane."""
+import functools
 import os
 import subprocess
 from shutil import copyfile
@@ -28,6 +29,22 @@ from . import openfermion
 # Bohr-Angstrom correlation coefficient (https://physics.nist.gov/cgi-bin/cuu/Value?bohrrada0)
 bohr_angs = 0.529177210903
 
+_PAULIS = {"X": qml.PauliX, "Y": qml.PauliY, "Z": qml.PauliZ, "I": qml.Identity}
+
+
+@functools.lru_cache(maxsize=None, typed=True)
+def _pauli(axis, wire):
+    """Returns a cached single-qubit Pauli observable, or the identity, acting on ``wire``.
+
+    Args:
+        axis (str): one of ``'X'``, ``'Y'``, ``'Z'`` or ``'I'``
+        wire (Any): wire label the observable acts on
+
+    Returns:
+        pennylane.operation.Observable: the observable, created without being queued
+    """
+    return _PAULIS[axis](wires=wire, do_queue=False)
+
 
 def _process_wires(wires, n_wires=None):
     r"""
@@ -564,17 +581,15 @@ def _qubit_operator_to_terms(qubit_operator, wires=None):
     wires = _process_wires(wires, n_wires=n_wires)
 
     if not qubit_operator.terms:  # added since can't unpack empty zip to (coeffs, ops) below
-        return np.array([0.0]), [qml.operation.Tensor(qml.Identity(wires[0]))]
-
-    xyz2pauli = {"X": qml.PauliX, "Y": qml.PauliY, "Z": qml.PauliZ}
+        return np.array([0.0]), [qml.operation.Tensor(_pauli("I", wires[0]))]
 
     coeffs, ops = zip(
         *[
             (
                 coef,
-                qml.operation.Tensor(*[xyz2pauli[q[1]](wires=wires[q[0]]) for q in term])
+                qml.operation.Tensor(*[_pauli(q[1], wires[q[0]]) for q in term])
                 if term
-                else qml.operation.Tensor(qml.Identity(wires[0]))
+                else qml.operation.Tensor(_pauli("I", wires[0]))
                 # example term: ((0,'X'), (2,'Z'), (3,'Y'))
             )
             for term, coef in qubit_operator.terms.items()
@@ -627,6 +642,8 @@ def _terms_to_qubit_operator(coeffs, ops, wires=None):
     else:
         qubit_indexed_wires = all_wires
 
+    wire_to_qubit = {wire: qubit for qubit, wire in enumerate(qubit_indexed_wires)}
+
     q_op = openfermion.QubitOperator()
     for coeff, op in zip(coeffs, ops):
 
@@ -640,20 +657,15 @@ def _terms_to_qubit_operator(coeffs, ops, wires=None):
         # Pauli axis names, note s[-1] expects only 'Pauli{X,Y,Z}'
         pauli_names = [s[-1] if s != "Identity" else s for s in op.name]
 
-        all_identity = all(obs.name == "Identity" for obs in op.obs)
-        if (op.name == ["Identity"] and len(op.wires) == 1) or all_identity:
-            term_str = ""
-        else:
-            term_str = " ".join(
-                [
-                    "{}{}".format(pauli, qubit_indexed_wires.index(wire))
-                    for pauli, wire in zip(pauli_names, op.wires)
-                    if pauli != "Identity"
-                ]
-            )
+        # OpenFermion term, e.g., ((0, 'X'), (2, 'Z')); identities are dropped so that an
+        # all-identity product becomes the empty term
+        term = tuple(
+            (wire_to_qubit[wire], pauli)
+            for pauli, wire in zip(pauli_names, op.wires)
+            if pauli != "Identity"
+        )
 
-        # This is how one makes QubitOperator in OpenFermion
-        q_op += coeff * openfermion.QubitOperator(term_str)
+        q_op += coeff * openfermion.QubitOperator(term)
 
     return q_op
 
@@ -7,33 +7,9 @@ from pennylane import qchem
 
 from openfermion import QubitOperator
 
-terms_h20_jw_full = {
-    (): (7 + 0j),
-    ((0, "Z"),): (-0.5 + 0j),
-    ((1, "Z"),): (-0.5 + 0j),
-    ((2, "Z"),): (-0.5 + 0j),
-    ((3, "Z"),): (-0.5 + 0j),
-    ((4, "Z"),): (-0.5 + 0j),
-    ((5, "Z"),): (-0.5 + 0j),
-    ((6, "Z"),): (-0.5 + 0j),
-    ((7, "Z"),): (-0.5 + 0j),
-    ((8, "Z"),): (-0.5 + 0j),
-    ((9, "Z"),): (-0.5 + 0j),
-    ((10, "Z"),): (-0.5 + 0j),
-    ((11, "Z"),): (-0.5 + 0j),
-    ((12, "Z"),): (-0.5 + 0j),
-    ((13, "Z"),): (-0.5 + 0j),
-}
+terms_h20_jw_full = {(): (7 + 0j), **{((i, "Z"),): (-0.5 + 0j) for i in range(14)}}
 
-terms_h20_jw_23 = {
-    (): (3 + 0j),
-    ((0, "Z"),): (-0.5 + 0j),
-    ((1, "Z"),): (-0.5 + 0j),
-    ((2, "Z"),): (-0.5 + 0j),
-    ((3, "Z"),): (-0.5 + 0j),
-    ((4, "Z"),): (-0.5 + 0j),
-    ((5, "Z"),): (-0.5 + 0j),
-}
+terms_h20_jw_23 = {(): (3 + 0j), **{((i, "Z"),): (-0.5 + 0j) for i in range(6)}}
 
 terms_h20_bk_44 = {
     (): (4 + 0j),
@@ -71,7 +47,7 @@ terms_lih_anion_bk = {
         (10, "bravyi_KITAEV", terms_lih_anion_bk),
     ],
 )
-def test_particle_number_observable(orbitals, mapping, terms_exp, custom_wires, monkeypatch):
+def test_particle_number_observable(orbitals, mapping, terms_exp, custom_wires):
     r"""Tests the correctness of the particle number observable :math:`\hat{N}` generated
     by the ``'particle_number'`` function.
 
@@ -83,11 +59,25 @@ def test_particle_number_observable(orbitals, mapping, terms_exp, custom_wires,
     N = qchem.particle_number(orbitals, mapping=mapping, wires=custom_wires)
 
     particle_number_qubit_op = QubitOperator()
-    monkeypatch.setattr(particle_number_qubit_op, "terms", terms_exp)
+    particle_number_qubit_op.terms = terms_exp
 
     assert qchem._qubit_operators_equivalent(particle_number_qubit_op, N, wires=custom_wires)
 
 
+def test_particle_number_reuses_pauli_observables():
+    r"""Tests that repeated calls of ``'particle_number'`` build their terms from the same
+    cached single-qubit Pauli observables."""
+
+    N1 = qchem.particle_number(4, wires=["w0", "w1", "w2", "w3"])
+    N2 = qchem.particle_number(4, wires=["w0", "w1", "w2", "w3"])
+
+    obs1 = [ob for op in N1.ops for ob in op.obs]
+    obs2 = [ob for op in N2.ops for ob in op.obs]
+
+    assert [id(ob) for ob in obs1] == [id(ob) for ob in obs2]
+    assert [ob.wires.tolist() for ob in obs1] == [["w0"], ["w0"], ["w1"], ["w2"], ["w3"]]
+
+
 @pytest.mark.parametrize(
     ("orbitals", "msg_match"),
     [
@@ -101,3 +91,11 @@ def test_exception_particle_number(orbitals, msg_match):
 
     with pytest.raises(ValueError, match=msg_match):
         qchem.particle_number(orbitals)
+
+
+def test_exception_particle_number_mapping():
+    """Test that the function `'particle_number'` throws an exception if the
+    fermion-to-qubit mapping is not available."""
+
+    with pytest.raises(TypeError, match="transformation is not available"):
+        qchem.particle_number(4, mapping="parity")
@@ -286,6 +286,19 @@ class TestGroupingUtils:
         adj = qwc_complement_adj_matrix(binary_obs_tuple)
         assert np.all(adj == expected)
 
+    @pytest.mark.parametrize("m_terms, n_qubits", [(1, 1), (7, 2), (20, 5)])
+    def test_qwc_complement_adj_matrix_matches_is_qwc(self, m_terms, n_qubits):
+        """Tests that the ``qwc_complement_adj_matrix`` function agrees with pairwise
+        ``is_qwc`` checks."""
+        rng = np.random.default_rng(42)
+        binary_observables = rng.integers(0, 2, size=(m_terms, 2 * n_qubits))
+
+        expected = np.array(
+            [[float(not is_qwc(a, b)) for b in binary_observables] for a in binary_observables]
+        )
+
+        assert np.all(qwc_complement_adj_matrix(binary_observables) == expected)
+
     def test_qwc_complement_adj_matrix_exception(self):
         """Tests that the ``qwc_complement_adj_matrix`` function raises an exception if
         the matrix is not binary."""
@@ -300,6 +313,22 @@ class TestGroupingUtils:
         with pytest.raises(ValueError, match="Expected a binary array, instead got"):
             qwc_complement_adj_matrix(not_binary_observables)
 
+    def test_qwc_complement_adj_matrix_odd_components_exception(self):
+        """Tests that the ``qwc_complement_adj_matrix`` function raises an exception if
+        the rows have an odd number of components."""
+        binary_observables = np.array([[1.0, 0.0, 1.0], [0.0, 1.0, 1.0]])
+
+        with pytest.raises(ValueError, match="Expected an even number of binary components"):
+            qwc_complement_adj_matrix(binary_observables)
+
+    @pytest.mark.parametrize("binary_observables", [[], np.zeros((0, 4))])
+    def test_qwc_complement_adj_matrix_no_terms(self, binary_observables):
+        """Tests that the ``qwc_complement_adj_matrix`` function returns an empty matrix if
+        there are no Pauli words."""
+        adj = qwc_complement_adj_matrix(binary_observables)
+
+        assert adj.shape == (0, 0)
+
     @pytest.mark.parametrize(
         "pauli_word,wire_map,expected_string",
         [
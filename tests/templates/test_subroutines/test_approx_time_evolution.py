@@ -18,6 +18,7 @@ import pytest
 import numpy as np
 from pennylane import numpy as pnp
 import pennylane as qml
+from pennylane.wires import Wires
 
 
 class TestDecomposition:
@@ -158,6 +159,20 @@ class TestDecomposition:
 
         assert np.allclose(dev.state, dev2.state, atol=tol, rtol=0)
 
+    def test_cached_words_on_different_wires(self):
+        """Tests that terms sharing a Pauli word but acting on different wires are expanded
+        with their own wires"""
+        h1 = qml.Hamiltonian([1], [qml.PauliX(0) @ qml.PauliZ(1)])
+        h2 = qml.Hamiltonian([0.5], [qml.PauliX("a") @ qml.PauliZ("b")])
+
+        ops1 = qml.templates.ApproxTimeEvolution(h1, 1, 1).expand().operations
+        ops2 = qml.templates.ApproxTimeEvolution(h2, 1, 1).expand().operations
+
+        assert ops1[0].parameters == [2, "XZ"]
+        assert ops1[0].wires == Wires([0, 1])
+        assert ops2[0].parameters == [1, "XZ"]
+        assert ops2[0].wires == Wires(["a", "b"])
+
 
 class TestInputs:
     """Test inputs and pre-processing."""
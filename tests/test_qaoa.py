@@ -112,6 +112,17 @@ class TestMixerHamiltonians:
         assert mixer_ops == ["PauliX", "PauliX", "PauliX", "PauliX"]
         assert mixer_wires == [0, 1, 2, 3]
 
+    def test_x_mixer_cached(self):
+        """Tests that repeated calls to the Pauli-X mixer return independent Hamiltonians"""
+
+        H1 = qaoa.x_mixer(range(3))
+        H1 *= 2
+        H2 = qaoa.x_mixer([0, 1, 2])
+
+        assert H1 is not H2
+        assert H2.coeffs == [1, 1, 1]
+        assert all(o1 is o2 for o1, o2 in zip(H1.ops, H2.ops))
+
     def test_xy_mixer_type_error(self):
         """Tests that the XY mixer throws the correct error"""
 
@@ -673,6 +684,47 @@ class TestCostHamiltonians:
         H = qaoa.edge_driver(graph, reward)
         assert decompose_hamiltonian(H) == decompose_hamiltonian(hamiltonian)
 
+    def test_edge_driver_cached(self):
+        """Tests that repeated calls to the edge driver reuse the cached observables, while
+        returning independent Hamiltonians"""
+
+        graph = Graph([(0, 1), (1, 2)])
+
+        H1 = qaoa.edge_driver(graph, ["11", "10", "01"])
+        H2 = qaoa.edge_driver(graph, ["01", "10", "11"])
+
+        assert H1 is not H2
+
+        for o1, o2 in zip(H1.ops, H2.ops):
+            if isinstance(o1, qml.operation.Tensor):
+                assert o1 is not o2
+                assert all(f1 is f2 for f1, f2 in zip(o1.obs, o2.obs))
+            else:
+                assert o1 is o2
+
+        H1 += qml.PauliX(0)
+        H3 = qaoa.edge_driver(graph, ["11", "10", "01"])
+
+        assert decompose_hamiltonian(H2) == decompose_hamiltonian(H3)
+
+    def test_cost_hamiltonian_terms_not_shared(self):
+        """Tests that modifying a tensor term of a cost Hamiltonian in-place does not change the
+        cost Hamiltonians returned by later calls"""
+
+        graph = Graph([(0, 1), (1, 2)])
+
+        cost_h, _ = qaoa.maxcut(graph)
+        cost_h.ops[0] @ qml.PauliX(5)
+
+        cost_h, _ = qaoa.maxcut(Graph([(0, 1), (1, 2)]))
+        expected = qml.Hamiltonian(
+            [0.5, 0.5, -1],
+            [qml.PauliZ(0) @ qml.PauliZ(1), qml.PauliZ(1) @ qml.PauliZ(2), qml.Identity(0)],
+        )
+
+        assert cost_h.compare(expected)
+        assert all(5 not in op.wires for op in cost_h.ops)
+
     """Tests the cost Hamiltonians"""
 
     def test_max_weight_cycle_errors(self):
@@ -704,6 +756,21 @@ class TestCostHamiltonians:
         assert decompose_hamiltonian(cost_hamiltonian) == decompose_hamiltonian(cost_h)
         assert decompose_hamiltonian(mixer_hamiltonian) == decompose_hamiltonian(mixer_h)
 
+    @pytest.mark.parametrize(
+        "graph", [nx.MultiGraph([(0, 1), (0, 1), (1, 2)]), nx.DiGraph([(0, 1), (1, 0), (1, 2)])]
+    )
+    def test_maxcut_repeated_edges(self, graph):
+        """Tests that the MaxCut cost Hamiltonian combines the terms of repeated edges"""
+
+        cost_h, _ = qaoa.maxcut(graph)
+        assert len(cost_h.ops) == 3
+
+        expected = qml.Hamiltonian(
+            [1.0, 0.5, -1.5],
+            [qml.PauliZ(0) @ qml.PauliZ(1), qml.PauliZ(1) @ qml.PauliZ(2), qml.Identity(0)],
+        )
+        assert cost_h.compare(expected)
+
     @pytest.mark.parametrize(("graph", "constrained", "cost_hamiltonian", "mixer_hamiltonian"), MIS)
     def test_mis_output(self, graph, constrained, cost_hamiltonian, mixer_hamiltonian):
         """Tests that the output of the Max Indepenent Set method is correct"""
@@ -733,6 +800,41 @@ class TestCostHamiltonians:
         assert decompose_hamiltonian(cost_hamiltonian) == decompose_hamiltonian(cost_h)
         assert decompose_hamiltonian(mixer_hamiltonian) == decompose_hamiltonian(mixer_h)
 
+    def test_max_clique_modified_graph(self):
+        """Tests that the Maximum Clique Hamiltonians are updated when the input graph is modified
+        between calls"""
+
+        graph = Graph([(0, 1), (1, 2)])
+        qaoa.max_clique(graph, constrained=False)
+
+        graph.add_edge(0, 2)
+        cost_h, _ = qaoa.max_clique(graph, constrained=False)
+
+        expected = qml.Hamiltonian([1, 1, 1], [qml.PauliZ(0), qml.PauliZ(1), qml.PauliZ(2)])
+        assert decompose_hamiltonian(cost_h) == decompose_hamiltonian(expected)
+
+    @pytest.mark.parametrize("constrained", [True, False])
+    def test_max_clique_multigraph(self, constrained):
+        """Tests that the Maximum Clique Hamiltonians of a multigraph match those built from the
+        complement given by NetworkX"""
+
+        graph = nx.MultiGraph([(0, 1), (0, 1), (1, 2)])
+        cost_h, mixer_h = qaoa.max_clique(graph, constrained=constrained)
+
+        complement = nx.complement(graph)
+        if constrained:
+            expected_cost = qaoa.bit_driver(graph.nodes, 1)
+            expected_mixer = qaoa.bit_flip_mixer(complement, 0)
+        else:
+            expected_cost = 3 * qaoa.edge_driver(complement, ["10", "01", "00"]) + qaoa.bit_driver(
+                graph.nodes, 1
+            )
+            expected_mixer = qaoa.x_mixer(graph.nodes)
+
+        assert cost_h.compare(expected_cost)
+        assert mixer_h.compare(expected_mixer)
+        assert not any(op.wires.tolist() == [1, 2] for op in cost_h.ops + mixer_h.ops)
+
     @pytest.mark.parametrize(
         ("graph", "constrained", "cost_hamiltonian", "mixer_hamiltonian", "mapping"), MWC
     )
@@ -859,7 +961,7 @@ class TestLayers:
             prep = [i.name, i.parameters, i.wires]
             target = [j.name, j.parameters, j.wires]
 
-        assert prep == target
+            assert prep == target
 
 
 class TestIntegration:
@@ -889,12 +991,13 @@ class TestIntegration:
 
         # Defines the device and the QAOA cost function
         dev = qml.device("default.qubit", wires=len(wires))
-        cost_function = qml.ExpvalCost(circuit, cost_h, dev)
+        cost_function = qml.ExpvalCost(circuit, cost_h, dev, optimize=True)
 
         res = cost_function([[1, 1], [1, 1]])
         expected = -1.8260274380964299
 
         assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert dev.num_executions == 1
 
 
 class TestCycles:
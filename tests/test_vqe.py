@@ -171,6 +171,13 @@ simplify_hamiltonians = [
         ),
         qml.Hamiltonian([], []),
     ),
+    # Term reappears after cancelling out
+    (
+        qml.Hamiltonian(
+            [1, -1, 2, 1], [qml.PauliX(0), qml.PauliX(0), qml.PauliX(0), qml.PauliZ(1)]
+        ),
+        qml.Hamiltonian([2, 1], [qml.PauliX(0), qml.PauliZ(1)]),
+    ),
     (
         qml.Hamiltonian(
             [1, -1],
@@ -666,6 +673,14 @@ class TestHamiltonian:
         with pytest.raises(ValueError, match="coefficients are not real-valued"):
             H = qml.vqe.Hamiltonian(coeffs, obs)
 
+    def test_hamiltonian_complex_dtype_real_values(self):
+        """Tests that complex coefficients with vanishing imaginary parts are accepted"""
+        coeffs = np.array([0.2 + 0j, -1 + 0j])
+        obs = [qml.PauliX(0), qml.PauliZ(1)]
+
+        H = qml.vqe.Hamiltonian(coeffs, obs)
+        assert np.allclose(H.coeffs, [0.2, -1])
+
     @pytest.mark.parametrize(
         "obs", [[qml.PauliX(0), qml.CNOT(wires=[0, 1])], [qml.PauliZ, qml.PauliZ(0)]]
     )
@@ -706,6 +721,30 @@ class TestHamiltonian:
         old_H.simplify()
         assert old_H.compare(new_H)
 
+    def test_simplify_after_modifying_terms(self):
+        """Tests that a simplified Hamiltonian combines like-terms again after its terms are
+        modified in-place"""
+        H = qml.Hamiltonian(
+            [1, 1],
+            [
+                qml.PauliX(0) @ qml.PauliZ(1) @ qml.PauliY(2),
+                qml.PauliX(0) @ qml.PauliZ(1),
+            ],
+            simplify=True,
+        )
+        H.ops[1] @ qml.PauliY(2)
+
+        expected = qml.Hamiltonian([2], [qml.PauliX(0) @ qml.PauliZ(1) @ qml.PauliY(2)])
+        assert H.compare(expected)
+
+        H.ops.append(qml.PauliX(0) @ qml.PauliZ(1) @ qml.PauliY(2))
+        H.coeffs.append(1)
+        H.simplify()
+
+        expected = qml.Hamiltonian([3], [qml.PauliX(0) @ qml.PauliZ(1) @ qml.PauliY(2)])
+        assert H.compare(expected)
+        assert len(H.ops) == 1
+
     def test_data(self):
         """Tests the obs_data method"""
 
@@ -757,6 +796,16 @@ class TestHamiltonian:
         """Tests that Hamiltonians are tensored correctly"""
         assert H.compare(H1 @ H2)
 
+    def test_hamiltonian_matmul_does_not_mutate_terms(self):
+        """Tests that tensoring a Hamiltonian with an observable leaves the original terms unchanged"""
+        t = qml.PauliX(0) @ qml.PauliZ(1)
+        H = qml.Hamiltonian([1], [t])
+
+        res = H @ qml.PauliY(2)
+
+        assert t.name == ["PauliX", "PauliZ"]
+        assert res.compare(qml.PauliX(0) @ qml.PauliZ(1) @ qml.PauliY(2))
+
     def test_hamiltonian_same_wires(self):
         """Test if a ValueError is raised when multiplication between Hamiltonians acting on the
         same wires is attempted"""
@@ -88,6 +88,14 @@ class TestHamiltonianExpval:
 
         assert np.isclose(output, expval)
 
+    def test_grouped_tapes(self):
+        """Tests that qubit-wise commuting terms are measured in the same tape"""
+
+        tapes, _ = qml.transforms.hamiltonian_expand(tape2)
+
+        assert len(tapes) == 2
+        assert sorted(len(t.measurements) for t in tapes) == [2, 3]
+
     def test_hamiltonian_error(self):
 
         with pennylane.tape.QuantumTape() as tape: